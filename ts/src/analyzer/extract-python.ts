@@ -3,6 +3,7 @@ import { basename, join, relative, dirname } from "node:path";
 import { minimatch } from "minimatch";
 import Parser from "tree-sitter";
 import Python from "tree-sitter-python";
+import { buildSummaries } from "./summaries.js";
 
 export async function runExtract(opts: { targetDir: string; outPath: string; verbose?: boolean; analyzer?: { exclude?: string[]; includeOnly?: string[]; excludeModules?: string[] } }) {
   const parser = new Parser();
@@ -81,7 +82,9 @@ export async function runExtract(opts: { targetDir: string; outPath: string; ver
   // Filter edges to only include those whose endpoints exist as nodes
   const nodeIds = new Set(nodes.map(n => n.id));
   const edges = edgesRaw.filter(e => nodeIds.has(e.source) && nodeIds.has(e.target));
-  const graph = { version: 1, schemaVersion: "1.0.0", id_prefix: "", defaultMode: "exec", rootDir: toUnix(opts.targetDir), nodes, edges, groups, moduleImports: moduleImportsArr };
+  // Precompute level-of-detail summaries so the viewer can paint coarse levels first
+  const summaries = buildSummaries({ nodes, edges, groups, moduleImports: moduleImportsArr });
+  const graph = { version: 1, schemaVersion: "1.0.0", id_prefix: "", defaultMode: "exec", rootDir: toUnix(opts.targetDir), nodes, edges, groups, moduleImports: moduleImportsArr, summaries };
   await mkdir(dirname(opts.outPath), { recursive: true });
   await writeFile(opts.outPath, JSON.stringify(graph, null, 2), "utf8");
 }
@@ -3,6 +3,7 @@ import { basename, join, relative, dirname } from "node:path";
 import { minimatch } from "minimatch";
 import Parser from "tree-sitter";
 import JavaScript from "tree-sitter-javascript";
+import { buildSummaries } from "./summaries.js";
 
 export async function runExtract(opts: { targetDir: string; outPath: string; verbose?: boolean; analyzer?: { exclude?: string[]; includeOnly?: string[]; excludeModules?: string[] } }) {
   const parser = new Parser();
@@ -168,6 +169,9 @@ export async function runExtract(opts: { targetDir: string; outPath: string; ver
     }
   } catch {}
 
+  // Recompute level-of-detail summaries over the (possibly merged) graph
+  graph.summaries = buildSummaries(graph);
+
   await mkdir(dirname(opts.outPath), { recursive: true });
   await writeFile(opts.outPath, JSON.stringify(graph, null, 2), "utf8");
 }
@@ -0,0 +1,146 @@
+// Precomputed level-of-detail summaries for the viewer.
+//
+// Levels, coarse → fine:
+// - folder:   top-level folders (plus modules that live at the target root)
+// - package:  every folder in the chain, as the viewer nests them (plus root-level modules);
+//             nodes only, so an expanded folder's subfolders can be looked up
+// - module:   one node per module group
+//
+// Function-level edges are not written: the viewer derives them from `edges` at load
+// rather than shipping the largest part of the file twice.
+//
+// Summary node ids match the compound ids the viewer creates (`folder:<path>`,
+// `module:<name>`), and a given id has the same definition at every level it
+// appears in: a folder's children are its immediate subfolders and modules, a
+// module's children are its function ids, and `size` counts every function
+// underneath. A level can therefore be rendered directly and any group swapped
+// for its children when expanded. Edges between the groups of the folder and module
+// levels (the viewer's two starting points) are aggregated from graph edges (keeping
+// their kind) and from moduleImports (`kind: "imports"`); edges internal to a group
+// are dropped at that level.
+//
+// These types are the single declaration; the viewer re-exports them from graph-types.ts.
+
+export type SummaryNode = {
+  id: string;
+  label: string;
+  type: "folder" | "module";
+  path: string;
+  children: string[]; // immediate subfolders and modules (function ids for modules)
+  size: number; // number of function nodes contained
+};
+
+export type SummaryEdge = {
+  source: string;
+  target: string;
+  kind: string; // a graph edge kind ("calls", "runtime_call", ...) or "imports"
+  weight: number;
+};
+
+export type SummaryLevel = { nodes: SummaryNode[]; edges: SummaryEdge[] };
+
+export type GraphSummaries = {
+  folder: SummaryLevel;
+  package: { nodes: SummaryNode[] };
+  module: SummaryLevel;
+};
+
+type GraphLike = {
+  nodes: { id: string; module: string; file?: string }[];
+  edges: { source: string; target: string; kind: string }[];
+  groups: { id: string; kind: string; children: string[] }[];
+  moduleImports?: { source: string; target: string; weight?: number }[];
+};
+
+export function buildSummaries(graph: GraphLike): GraphSummaries {
+  // Module -> folder path (first file seen per module, as in the viewer)
+  const moduleToFolder = new Map<string, string>();
+  for (const n of graph.nodes) {
+    if (n.module && n.file && !moduleToFolder.has(n.module)) {
+      const idx = n.file.lastIndexOf("/");
+      moduleToFolder.set(n.module, idx >= 0 ? n.file.slice(0, idx) : "");
+    }
+  }
+  const modules = graph.groups.filter(g => g.kind === "module");
+  const moduleIds = new Set(modules.map(g => g.id));
+  const nodeIds = new Set(graph.nodes.map(n => n.id));
+  const nodeModule = new Map(graph.nodes.map(n => [n.id, n.module] as const));
+
+  const moduleKey = (mod: string) => `module:${mod}`;
+  const folderKey = (mod: string) => {
+    const folder = moduleToFolder.get(mod) ?? "";
+    return folder ? `folder:${folder.split("/")[0]}` : moduleKey(mod);
+  };
+
+  // Call sites deduped into weighted function-to-function edges (not written out)
+  const functionEdges = aggregateEdges(
+    graph.edges.filter(e => nodeIds.has(e.source) && nodeIds.has(e.target)).map(e => ({ source: e.source, target: e.target, kind: e.kind }))
+  );
+
+  const moduleNodes = modules.map((g): SummaryNode => {
+    const name = g.id.split(/[\\/]/).pop() || g.id;
+    const children = g.children.filter(c => nodeIds.has(c));
+    return { id: moduleKey(g.id), label: name, type: "module", path: g.id, children, size: children.length };
+  });
+
+  // Folder chain, nested the same way as the viewer's folder compounds (a → a/b → a/b/c)
+  const folderById = new Map<string, SummaryNode>();
+  const rootModules: SummaryNode[] = [];
+  for (const mn of moduleNodes) {
+    const folder = moduleToFolder.get(mn.path) ?? "";
+    if (!folder) {
+      rootModules.push(mn);
+      continue;
+    }
+    const parts = folder.split("/").filter(Boolean);
+    for (let i = 0; i < parts.length; i++) {
+      const path = parts.slice(0, i + 1).join("/");
+      const id = `folder:${path}`;
+      let fn = folderById.get(id);
+      if (!fn) {
+        fn = { id, label: parts[i], type: "folder", path, children: [], size: 0 };
+        folderById.set(id, fn);
+      }
+      const child = i + 1 < parts.length ? `folder:${parts.slice(0, i + 2).join("/")}` : mn.id;
+      if (!fn.children.includes(child)) fn.children.push(child);
+      fn.size += mn.size;
+    }
+  }
+  const allFolders = Array.from(folderById.values());
+  const topFolders = allFolders.filter(fn => !fn.path.includes("/"));
+
+  // Aggregate function edges (weighted) and moduleImports onto groups at a level
+  function aggregateGroups(keyOf: (mod: string) => string): SummaryEdge[] {
+    const mapped: SummaryEdge[] = [];
+    for (const e of functionEdges) {
+      const sm = nodeModule.get(e.source);
+      const tm = nodeModule.get(e.target);
+      if (sm && tm && moduleIds.has(sm) && moduleIds.has(tm)) mapped.push({ source: keyOf(sm), target: keyOf(tm), kind: e.kind, weight: e.weight });
+    }
+    for (const im of graph.moduleImports ?? []) {
+      if (moduleIds.has(im.source) && moduleIds.has(im.target)) mapped.push({ source: keyOf(im.source), target: keyOf(im.target), kind: "imports", weight: Number(im.weight) || 1 });
+    }
+    return aggregateEdges(mapped);
+  }
+
+  return {
+    folder: { nodes: [...topFolders, ...rootModules], edges: aggregateGroups(folderKey) },
+    package: { nodes: [...allFolders, ...rootModules] },
+    module: { nodes: moduleNodes, edges: aggregateGroups(moduleKey) }
+  };
+}
+
+// Sum weights of parallel edges (same source, kind and target); self-edges are
+// internal to a group and dropped
+function aggregateEdges(edges: { source: string; target: string; kind: string; weight?: number }[]): SummaryEdge[] {
+  const weights = new Map<string, SummaryEdge>();
+  for (const e of edges) {
+    const { source, target, kind } = e;
+    if (source === target) continue;
+    const k = `${source}->${kind}->${target}`;
+    const cur = weights.get(k);
+    if (cur) cur.weight += e.weight ?? 1;
+    else weights.set(k, { source, target, kind, weight: e.weight ?? 1 });
+  }
+  return Array.from(weights.values());
+}
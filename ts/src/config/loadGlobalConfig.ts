@@ -14,6 +14,7 @@ export type GlobalConfig = {
   viewer?: {
     host?: string;
     port?: number;
+    lodMinNodes?: number;
   };
   extractAll?: {
     languages?: string[];
@@ -256,8 +256,11 @@ export async function startServer(opts: { host: string; port: number; openBrowse
     // Load global config for viewer highlight settings and colors if present
     let highlight: any = undefined;
     let colors: any = undefined;
+    let lodMinNodes: number | undefined = undefined;
     try {
       const gcfg: any = await loadGlobalConfig();
+      const lv = Number(gcfg?.viewer?.lodMinNodes);
+      lodMinNodes = Number.isFinite(lv) ? lv : undefined;
       const hv = (gcfg && gcfg.viewer && gcfg.viewer.highlight) ? gcfg.viewer.highlight : undefined;
       highlight = hv ? hv : undefined;
       const cv = (gcfg && gcfg.viewer && (gcfg.viewer as any).colors) ? (gcfg.viewer as any).colors : undefined;
@@ -293,7 +296,8 @@ export async function startServer(opts: { host: string; port: number; openBrowse
       projectName,
       configStem,
       highlight,
-      colors
+      colors,
+      lodMinNodes
     };
     reply.type("application/json").send(cfg);
   });
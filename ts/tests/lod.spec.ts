@@ -0,0 +1,84 @@
+import { test, expect } from '@playwright/test';
+
+// Force the level-of-detail start regardless of graph size
+test.beforeEach(async ({ page }) => {
+  await page.route('**/viewer-config.json', async (route) => {
+    const response = await route.fetch();
+    const json = await response.json();
+    await route.fulfill({ response, json: { ...json, lodMinNodes: 0 } });
+  });
+  await page.goto('/');
+  await page.waitForSelector('#cy canvas', { state: 'attached', timeout: 10000 });
+  await page.waitForFunction(() => {
+    const w: any = window as any;
+    try { return !!w.__cy && w.__cy.nodes().length > 0; } catch { return false; }
+  }, { timeout: 10000 });
+  // Graphs extracted before summaries existed open on the full graph
+  const hasSummaries = await page.evaluate(() => Boolean((window as any).__cv_graph?.summaries));
+  test.skip(!hasSummaries, 'served graph has no summaries; re-run extraction to produce them');
+  expect(await page.evaluate(() => (window as any).__cy.nodes('.cv-lod-collapsed').length)).toBeGreaterThan(0);
+});
+
+// Page coordinates of a node's centre
+const nodePoint = async (page: any, id: string) => {
+  const box = await page.locator('#cy').boundingBox();
+  const pos = await page.evaluate((nid: string) => (window as any).__cy.getElementById(nid).renderedPosition(), id);
+  return { x: box!.x + pos.x, y: box!.y + pos.y };
+};
+
+test('double-click swaps in only that group\'s children and stays in LOD mode', async ({ page }) => {
+  const evalCy = async <T>(fn: (...args: any[]) => T, ...args: any[]) => page.evaluate(fn, ...args);
+  expect(await evalCy(() => (window as any).__cv.isLodActive())).toBe(true);
+
+  // Pick a collapsed summary group and look up its children in the precomputed summaries
+  const target = await evalCy(() => {
+    const cy: any = (window as any).__cy;
+    const s: any = (window as any).__cv_graph.summaries;
+    const node = cy.nodes('.cv-lod-collapsed').first();
+    const id = String(node.id());
+    const def = [...s.folder.nodes, ...s.package.nodes, ...s.module.nodes].find((n: any) => n.id === id);
+    return { id, children: (def?.children ?? []).slice().sort() };
+  });
+  expect(target.children.length).toBeGreaterThan(0);
+  const before = await evalCy(() => (window as any).__cy.nodes('.cv-lod-collapsed').map((n: any) => String(n.id())).sort());
+
+  await evalCy((id: string) => { const cy: any = (window as any).__cy; cy.center(cy.getElementById(id)); }, target.id);
+  const pt = await nodePoint(page, target.id);
+  await page.mouse.dblclick(pt.x, pt.y);
+  await page.waitForFunction((id: string) => (window as any).__cy.getElementById(id).isParent(), target.id, { timeout: 10000 });
+
+  expect(await evalCy(() => (window as any).__cv.isLodActive())).toBe(true);
+  const shown = await evalCy((id: string) => (window as any).__cy.getElementById(id).children().map((n: any) => String(n.id())).sort(), target.id);
+  expect(shown).toEqual(target.children);
+
+  // Every other group keeps its summary node
+  const after = await evalCy(() => (window as any).__cy.nodes('.cv-lod-collapsed').map((n: any) => String(n.id())));
+  for (const id of before) {
+    if (id !== target.id) expect(after).toContain(id);
+  }
+  expect(after).not.toContain(target.id);
+});
+
+test('single tap on a summary group does not leave LOD mode', async ({ page }) => {
+  const id = await page.evaluate(() => String((window as any).__cy.nodes('.cv-lod-collapsed').first().id()));
+  await page.evaluate((nid: string) => { const cy: any = (window as any).__cy; cy.center(cy.getElementById(nid)); }, id);
+  const pt = await nodePoint(page, id);
+  await page.mouse.click(pt.x, pt.y);
+  await page.waitForTimeout(500);
+  expect(await page.evaluate(() => (window as any).__cv.isLodActive())).toBe(true);
+  expect(await page.evaluate((nid: string) => (window as any).__cy.getElementById(nid).hasClass('cv-lod-collapsed'), id)).toBe(true);
+});
+
+test('collapse-all returns to the coarse summary level', async ({ page }) => {
+  const evalCy = async <T>(fn: (...args: any[]) => T, ...args: any[]) => page.evaluate(fn, ...args);
+  const coarse = await evalCy(() => (window as any).__cy.nodes('.cv-lod-collapsed').map((n: any) => String(n.id())).sort());
+
+  await evalCy(() => { const cy: any = (window as any).__cy; (window as any).__cv.toggleLodGroup(String(cy.nodes('.cv-lod-collapsed').first().id())); });
+  await page.waitForFunction(() => (window as any).__cy.nodes('node:parent').length > 0, null, { timeout: 10000 });
+
+  await evalCy(() => (window as any).__cv.collapseAllLod());
+  const collapsed = await evalCy(() => (window as any).__cy.nodes('.cv-lod-collapsed').map((n: any) => String(n.id())).sort());
+  expect(collapsed).toEqual(coarse);
+  expect(await evalCy(() => (window as any).__cy.nodes('node:parent').length)).toBe(0);
+  expect(await evalCy(() => (window as any).__cv.isLodActive())).toBe(true);
+});
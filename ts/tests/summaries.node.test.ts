@@ -0,0 +1,110 @@
+import { strict as assert } from 'node:assert';
+import { buildSummaries } from '../src/analyzer/summaries.ts';
+import { buildLodIndex, lodEdgeElements, lodExpandElements, summaryToElements } from '../viewer/src/elements.ts';
+
+function sampleGraph(): any {
+  const fn = (id: string, file: string) => ({ id, label: id.split('.')[1], file, line: 1, module: id.split('.')[0], kind: 'function', tags: {} });
+  const nodes = [
+    fn('main.run', 'main.py'),
+    fn('recipe.create', 'models/recipe.py'),
+    fn('recipe.add', 'models/recipe.py'),
+    fn('helpers.fmt', 'utils/text/helpers.py'),
+  ];
+  const call = (source: string, target: string) => ({ source, target, kind: 'calls', conditions: [], order: null });
+  const edges = [
+    call('main.run', 'recipe.create'),
+    call('main.run', 'recipe.create'), // second call site
+    call('main.run', 'helpers.fmt'),
+    call('recipe.create', 'recipe.add'), // internal to the module
+    { source: 'helpers.fmt', target: 'main.run', kind: 'runtime_call', conditions: [], order: null },
+  ];
+  const groups = [
+    { id: 'main', kind: 'module', children: ['main.run'] },
+    { id: 'recipe', kind: 'module', children: ['recipe.create', 'recipe.add'] },
+    { id: 'helpers', kind: 'module', children: ['helpers.fmt'] },
+  ];
+  const moduleImports = [
+    { source: 'main', target: 'recipe', weight: 1 },
+    { source: 'main', target: 'typing', weight: 1 }, // not a module group
+  ];
+  const graph = { version: 1, schemaVersion: '1.0.0', nodes, edges, groups, moduleImports } as any;
+  graph.summaries = buildSummaries(graph);
+  return graph;
+}
+
+const edgeKeys = (edges: any[]) => new Set(edges.map((e: any) => `${e.source}->${e.kind}->${e.target}:${e.weight}`));
+
+(async function main() {
+  const graph = sampleGraph();
+  const s = graph.summaries;
+
+  // Folder level: top-level folders plus root modules
+  assert.deepEqual(s.folder.nodes.map((n: any) => n.id).sort(), ['folder:models', 'folder:utils', 'module:main']);
+  const utils = s.folder.nodes.find((n: any) => n.id === 'folder:utils');
+  assert.deepEqual(utils.children, ['folder:utils/text']);
+  assert.equal(utils.size, 1);
+  assert.deepEqual(s.folder.nodes.find((n: any) => n.id === 'module:main').children, ['main.run']);
+  assert.deepEqual(edgeKeys(s.folder.edges), new Set([
+    'module:main->calls->folder:models:2',
+    'module:main->calls->folder:utils:1',
+    'folder:utils->runtime_call->module:main:1',
+    'module:main->imports->folder:models:1',
+  ]));
+
+  // Package level lists the whole folder chain (nodes only)
+  assert.deepEqual(s.package.nodes.map((n: any) => n.id).sort(), ['folder:models', 'folder:utils', 'folder:utils/text', 'module:main']);
+  const text = s.package.nodes.find((n: any) => n.id === 'folder:utils/text');
+  assert.deepEqual(text.children, ['module:helpers']);
+  assert.equal(text.size, 1);
+  assert.equal(s.package.edges, undefined);
+  assert.equal(s.function, undefined);
+
+  // Module level drops edges internal to a module
+  assert.ok(!s.module.edges.some((e: any) => e.source === e.target));
+  assert.ok(edgeKeys(s.module.edges).has('module:main->calls->module:recipe:2'));
+
+  // Viewer: coarse level renders collapsed groups with the precomputed edges
+  const coarse = summaryToElements(graph, { groupFolders: true });
+  const collapsed = coarse.filter((el: any) => el.classes === 'cv-lod-collapsed').map((el: any) => el.data.id).sort();
+  assert.deepEqual(collapsed, ['folder:models', 'folder:utils', 'module:main']);
+  // Module imports stay in the data only (explore mode does not draw them)
+  const coarseEdges = coarse.filter((el: any) => el.data.source);
+  assert.equal(coarseEdges.length, s.folder.edges.filter((e: any) => e.kind !== 'imports').length);
+  assert.ok(!coarseEdges.some((el: any) => el.data.type === 'imports'));
+
+  // Expanding a folder reveals its immediate subfolder, nested as in the full view
+  const utilsOpen = summaryToElements(graph, { groupFolders: true, expanded: new Set(['folder:utils']) });
+  const sub = utilsOpen.find((el: any) => el.data.id === 'folder:utils/text')!;
+  assert.equal(sub.data.parent, 'folder:utils');
+  assert.equal(sub.data.depth, 2);
+  assert.equal(sub.classes, 'cv-lod-collapsed');
+
+  // Expanding a folder down to a module swaps in that module's functions only
+  const fine = summaryToElements(graph, { groupFolders: true, expanded: new Set(['folder:models', 'module:recipe']) });
+  const ids = new Set(fine.map((el: any) => el.data.id));
+  assert.ok(ids.has('recipe.create') && ids.has('recipe.add'));
+  assert.ok(!ids.has('helpers.fmt'));
+  assert.equal(fine.find((el: any) => el.data.id === 'recipe.create')!.data.parent, 'module:recipe');
+  // Function-level weights are derived from graph edges (two call sites)
+  assert.equal(fine.find((el: any) => el.data.id === 'lod:module:main->calls->recipe.create')!.data.weight, 2);
+  assert.ok(ids.has('lod:recipe.create->calls->recipe.add'));
+  assert.ok(ids.has('lod:folder:utils->runtime_call->module:main'));
+
+  // Incremental swap: expanding one group yields only its children and the edges touching them
+  const index = buildLodIndex(graph, true)!;
+  const expanded = new Set(['folder:models']);
+  const added = lodExpandElements(index, expanded, 'folder:models');
+  assert.deepEqual(added.map((el: any) => el.data.id).sort(), ['lod:module:main->calls->module:recipe', 'module:recipe']);
+  assert.equal(added.find((el: any) => el.data.id === 'module:recipe')!.data.parent, 'folder:models');
+  // ... and matches the full render of the same frontier
+  const full = summaryToElements(graph, { groupFolders: true, expanded });
+  const fullIds = new Set(full.map((el: any) => el.data.id));
+  assert.ok(added.every((el: any) => fullIds.has(el.data.id)));
+  // Collapsing back re-aggregates only the group's own edges
+  assert.deepEqual(lodEdgeElements(index, new Set(), ['folder:models']).map((el: any) => `${el.data.id}:${el.data.weight}`), ['lod:module:main->calls->folder:models:2']);
+
+  console.log('OK summaries.node.test');
+})().catch((err) => {
+  console.error(err);
+  process.exit(1);
+});
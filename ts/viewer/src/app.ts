@@ -8,7 +8,7 @@ import expandCollapse from "cytoscape-expand-collapse";
 import type { Core } from "cytoscape";
 import cxtmenu from "cytoscape-cxtmenu";
 (cytoscape as any).use(cxtmenu as any);
-import { graphToElements } from "./elements.js";
+import { buildLodIndex, graphToElements, lodEdgeElements, lodExpandElements, summaryToElements } from "./elements.js";
 import { generateStyles, applyModuleColorTint, applyGroupBackgroundColors } from "./style.js";
 import { defaultTokensLight } from "./style-tokens.js";
 import { InteractionManager } from "./interaction-manager.js";
@@ -48,7 +48,16 @@ export async function initApp() {
       if (n.module && n.file && !moduleToFile.has(n.module)) moduleToFile.set(n.module, n.file);
     }
   } catch {}
-  const elements = graphToElements(graph, { mode: 'explore' as any, groupFolders });
+  // Level-of-detail: on large graphs paint the precomputed coarse summary first and
+  // swap in finer levels only for the groups the user expands
+  const lodMinNodes = typeof vcfg.lodMinNodes === 'number' ? vcfg.lodMinNodes : 1500;
+  const lod = { active: Boolean(graph.summaries) && graph.nodes.length >= lodMinNodes, expanded: new Set<string>() };
+  let lodIndex = lod.active ? buildLodIndex(graph, groupFolders) : null;
+  let lodIndexFolders = groupFolders;
+  const tElements = performance.now();
+  const elements = lod.active
+    ? summaryToElements(graph, { groupFolders, expanded: lod.expanded, index: lodIndex })
+    : graphToElements(graph, { mode: 'explore' as any, groupFolders });
   const cy = cytoscape({
     container: document.getElementById('cy') as HTMLElement,
     elements,
@@ -63,6 +72,7 @@ export async function initApp() {
     // Allow Shift+drag box selection and Shift+click additive semantics
     boxSelectionEnabled: false
   });
+  try { console.debug(`[cv] ${elements.length} elements (${lod.active ? 'level-of-detail' : 'full graph'}) created in ${(performance.now()-tElements).toFixed(1)}ms`); } catch {}
   (window as any).__cy = cy; // expose for e2e tests
   ;(window as any).__cv_graph = graph; // expose graph for viewer ops
 
@@ -118,6 +128,103 @@ export async function initApp() {
     }
   } catch {}
 
+  // Keep a focused node highlighted across level-of-detail element changes (or drop
+  // the highlight when the node was folded away), so new elements match the rest
+  const refocusLod = (focusedId: string | null) => {
+    if (!focusedId) return;
+    try {
+      if (cy.getElementById(focusedId).empty()) im.clearFocus();
+      else im.focus(focusedId);
+    } catch {}
+  };
+  // Re-render the whole level-of-detail frontier (collapse-all or regrouping)
+  const renderLod = async () => {
+    const focusedId = cy.nodes('.focus').first().id() || null;
+    if (lodIndexFolders !== groupFolders) {
+      lodIndex = buildLodIndex(graph, groupFolders);
+      lodIndexFolders = groupFolders;
+    }
+    const lodElements = summaryToElements(graph, { groupFolders, expanded: lod.expanded, index: lodIndex });
+    cy.batch(() => {
+      cy.elements().remove();
+      cy.add(lodElements);
+      applyModuleColorTint(cy);
+      applyGroupBackgroundColors(cy, tokens);
+      try { updateAutoGroupVisibility(cy); } catch {}
+    });
+    refocusLod(focusedId);
+    await applyLayout(cy, layoutName, { hybridMode: vcfg.hybridMode as any });
+    try { requestAnimationFrame(() => { try { cy.resize(); cy.fit(cy.elements(':visible'), 20); } catch {} }); } catch {}
+  };
+  // Swap one group for its children (or back) in place. Everything else keeps its
+  // elements and positions; only the new children are laid out, around the group.
+  const swapLodGroup = async (id: string, expand: boolean) => {
+    const index = lodIndex;
+    const node = cy.getElementById(id);
+    if (!index || node.empty()) return;
+    const t0 = performance.now();
+    const focusedId = cy.nodes('.focus').first().id() || null;
+    const center = { ...node.position() };
+    cy.batch(() => {
+      if (expand) {
+        node.connectedEdges().remove();
+        node.removeClass('cv-lod-collapsed');
+        const added = cy.add(lodExpandElements(index, lod.expanded, id));
+        // Seed the new children on a small grid where the group was
+        const leaves = added.nodes().filter((n: any) => !n.isParent());
+        const cols = Math.max(1, Math.ceil(Math.sqrt(leaves.length)));
+        const gap = 90;
+        leaves.forEach((n: any, i: number) => {
+          n.position({ x: center.x + ((i % cols) - (cols - 1) / 2) * gap, y: center.y + (Math.floor(i / cols) - (cols - 1) / 2) * gap });
+        });
+      } else {
+        node.descendants().remove();
+        node.addClass('cv-lod-collapsed');
+        node.position(center);
+        const edges = lodEdgeElements(index, lod.expanded, [id]).filter((e) => cy.getElementById(String(e.data.id)).empty());
+        cy.add(edges);
+      }
+      applyModuleColorTint(cy);
+      applyGroupBackgroundColors(cy, tokens);
+      try { updateAutoGroupVisibility(cy); } catch {}
+    });
+    refocusLod(focusedId);
+    if (expand) {
+      // Same lightweight fCoSE pass the expand-collapse plugin uses, limited to this group
+      const inner = node.descendants();
+      const eles = node.union(inner).union(inner.connectedEdges().filter((e: any) => inner.contains(e.source()) && inner.contains(e.target())));
+      const layout = cy.layout({ name: 'fcose', eles, animate: false, randomize: false, numIter: 250, fit: false } as any);
+      const done = layout.promiseOn('layoutstop');
+      layout.run();
+      await done;
+    }
+    try { console.debug(`[cv] level-of-detail ${expand ? 'expand' : 'collapse'} '${id}' done in ${(performance.now()-t0).toFixed(1)}ms`); } catch {}
+  };
+  // Swap a group for its children (or back to its summary node).
+  // Returns false when the level-of-detail view is not active.
+  const toggleLodGroup = (id: string): boolean => {
+    if (!lod.active) return false;
+    const node = cy.getElementById(id);
+    if (!node || node.empty() || !node.data('lod')) return true;
+    const expand = !lod.expanded.has(id);
+    if (expand) {
+      lod.expanded.add(id);
+    } else {
+      lod.expanded.delete(id);
+      node.descendants().forEach((d: any) => { lod.expanded.delete(String(d.id())); });
+    }
+    // Defer the element swap: this runs inside tap handlers, and later tap listeners
+    // (focus, details pane, title) still expect the tapped elements to be in the graph
+    setTimeout(() => { swapLodGroup(id, expand).catch((err) => console.warn('level-of-detail toggle failed', err)); }, 0);
+    return true;
+  };
+  const collapseAllLod = (): boolean => {
+    if (!lod.active) return false;
+    lod.expanded.clear();
+    renderLod().catch((err) => console.warn('level-of-detail collapse failed', err));
+    return true;
+  };
+
   // Initialize expand/collapse if available (disable animation/fisheye; lightweight layout)
   try {
     const ec = (cy as any).expandCollapse
@@ -160,10 +267,43 @@ export async function initApp() {
         });
       } catch {}
     };
+    // Leave level-of-detail mode: build the full element set, keep the groups the user
+    // expanded open, and collapse the rest via the plugin. Features that need every
+    // entity materialised (search, lenses, commands) call this. Elements are swapped
+    // synchronously; the returned promise settles once the layout has run. Callers that
+    // run their own layout right after pass `{ layout: false }`.
+    const ensureFullGraph = async (opts: { layout?: boolean } = {}): Promise<void> => {
+      if (!lod.active) return;
+      lod.active = false;
+      const fullElements = graphToElements(graph, { mode: 'explore' as any, groupFolders });
+      cy.batch(() => {
+        cy.elements().remove();
+        cy.add(fullElements);
+        applyModuleColorTint(cy);
+        applyGroupBackgroundColors(cy, tokens);
+        try { updateAutoGroupVisibility(cy); } catch {}
+      });
+      try {
+        const api = (cy as any).expandCollapse ? (cy as any).expandCollapse('get') : null;
+        if (api) {
+          // Summary ids match the full compounds and expanded groups always have expanded ancestors
+          const groups = cy.nodes('node:parent').filter((n: any) => !lod.expanded.has(String(n.id())));
+          if (groups.length > 0) api.collapse(groups, { animate: false });
+          reaggregateEdges();
+        }
+      } catch {}
+      if (opts.layout === false) return;
+      try {
+        await applyLayout(cy, layoutName, { hybridMode: vcfg.hybridMode as any });
+        cy.resize();
+        cy.fit(cy.elements(':visible'), 20);
+      } catch {}
+    };
     // Expose for tests/devtools
-    (window as any).__cv = Object.assign((window as any).__cv || {}, { reaggregateCollapsedEdges: reaggregateEdges });
-    // Auto-collapse all groups (any compound node) on first load
-    if (ec) {
+    (window as any).__cv = Object.assign((window as any).__cv || {}, { reaggregateCollapsedEdges: reaggregateEdges, ensureFullGraph, toggleLodGroup, collapseAllLod, isLodActive: () => lod.active });
+    // Auto-collapse all groups (any compound node) on first load; the level-of-detail
+    // view starts collapsed already, with its group-level edges precomputed
+    if (ec && !lod.active) {
       const groups = cy.nodes('node:parent');
       if (groups && groups.length > 0) ec.collapse(groups, { animate: false });
       // After collapsing, aggregate edges only around collapsed groups
@@ -174,6 +314,7 @@ export async function initApp() {
       let lastTapTs = 0;
       let lastTapId: string | null = null;
       const toggleCollapse = (node: any) => {
+        if (toggleLodGroup(String(node.id()))) return;
         try {
           const api = (cy as any).expandCollapse('get');
           if (!api) return;
@@ -190,7 +331,7 @@ export async function initApp() {
           console.warn('expand/collapse toggle failed', err);
         }
       };
-      cy.on('tap', 'node:parent, node.cy-expand-collapse-collapsed-node', (evt) => {
+      cy.on('tap', 'node:parent, node.cy-expand-collapse-collapsed-node, node.cv-lod-collapsed', (evt) => {
         try {
           // Prefer native double-click count when available
           const oe: any = (evt as any).originalEvent;
@@ -340,6 +481,12 @@ export async function initApp() {
       groupFoldersToggle.checked = groupFolders;
       groupFoldersToggle.addEventListener('change', async () => {
         groupFolders = groupFoldersToggle.checked;
+        if (lod.active) {
+          lod.expanded.clear();
+          await renderLod();
+          scheduleOverviewRefresh();
+          return;
+        }
         const newElements = graphToElements(graph, { mode: 'explore' as any, groupFolders });
         cy.batch(() => {
           cy.elements().remove();
@@ -494,8 +641,9 @@ export async function initApp() {
   // Expand / Collapse all groups (if plugin available)
   const expandAllBtn = document.getElementById('expandAllBtn') as HTMLButtonElement | null;
   if (expandAllBtn) {
-    expandAllBtn.addEventListener('click', () => {
+    expandAllBtn.addEventListener('click', async () => {
       try {
+        try { await (window as any).__cv?.ensureFullGraph?.(); } catch {}
         const api = (cy as any).expandCollapse ? (cy as any).expandCollapse('get') : null;
         // Expand collapsed edges first to ensure original per-node edges are restored
         if (api && typeof api.expandAllEdges === 'function') api.expandAllEdges();
@@ -508,6 +656,7 @@ export async function initApp() {
   const collapseAllBtn = document.getElementById('collapseAllBtn') as HTMLButtonElement | null;
   if (collapseAllBtn) {
     collapseAllBtn.addEventListener('click', () => {
+      if (collapseAllLod()) return;
       try {
         const api = (cy as any).expandCollapse ? (cy as any).expandCollapse('get') : null;
         if (api && typeof api.collapseAll === 'function') api.collapseAll({ animate: false });
@@ -638,7 +787,9 @@ export async function initApp() {
       if (suggestions.length > 0) searchResultsEl.hidden = false;
     }
 
-    function focusNode(nodeId: string): void {
+    async function focusNode(nodeId: string): Promise<void> {
+      // Materialise (and lay out) the full graph before the local layout below runs
+      if (cy.getElementById(nodeId).empty()) { try { await (window as any).__cv?.ensureFullGraph?.(); } catch {} }
       try { im.clearFocus(); } catch {}
       try { im.focus(nodeId); } catch {}
       try {
@@ -659,7 +810,9 @@ export async function initApp() {
 
     searchBox.addEventListener('input', () => {
       clearTimeout(timer);
-      timer = setTimeout(() => {
+      timer = setTimeout(async () => {
+        // Searching needs every entity materialised
+        if (searchBox.value.trim()) { try { await (window as any).__cv?.ensureFullGraph?.(); } catch {} }
         // Keep existing filter behaviour
         search(cy, searchBox.value, 'fade');
         // Update suggestions dropdown
@@ -766,6 +919,11 @@ export async function initApp() {
           if (groupFoldersToggle) groupFoldersToggle.checked = enabled;
           if (enabled !== groupFolders) {
             groupFolders = enabled;
+            if (lod.active) {
+              lod.expanded.clear();
+              await renderLod();
+              return;
+            }
             const newElements = graphToElements(graph, { mode: 'explore' as any, groupFolders });
             cy.batch(() => {
               cy.elements().remove();
@@ -603,6 +603,8 @@ async function execCoreOp(cy: Core, q: string | undefined, op: string, arg?: any
 export async function executeCompactCommands(cy: Core, commands: CompactCommand[]): Promise<ExecutionResult> {
   const errors: string[] = [];
   let applied = 0;
+  // Selectors target entity ids, so leave the level-of-detail view first
+  if ((commands ?? []).length > 0) { try { await (window as any).__cv?.ensureFullGraph?.(); } catch {} }
   for (const cmd of commands ?? []) {
     try {
       const { q, op, arg, ops } = cmd || {} as CompactCommand;
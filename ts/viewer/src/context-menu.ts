@@ -93,8 +93,10 @@ export function installContextMenu(
     openMenuEvents: 'cxttapstart',
     commands: (ele: NodeSingular) => {
       const api = (cy as any).expandCollapse ? (cy as any).expandCollapse('get') : null;
-      const canExpand = !!api && api.isExpandable && api.isExpandable(ele);
-      const canCollapse = !!api && api.isCollapsible && api.isCollapsible(ele);
+      // Level-of-detail groups are swapped by the viewer rather than the plugin
+      const isLod = Boolean(ele.data('lod'));
+      const canExpand = isLod ? ele.hasClass('cv-lod-collapsed') : !!api && api.isExpandable && api.isExpandable(ele);
+      const canCollapse = isLod ? !ele.hasClass('cv-lod-collapsed') : !!api && api.isCollapsible && api.isCollapsible(ele);
       const toggleLabel = canExpand ? 'Expand' : (canCollapse ? 'Collapse' : 'Expand/Collapse');
       const selectedNodes = (cy as any).$(':selected').filter('node');
       const selectedCount = (selectedNodes as any).length ?? 0;
@@ -128,9 +130,10 @@ export function installContextMenu(
 
       cmds.push({
         content: toggleLabel,
-        enabled: !!api,
+        enabled: !!api || isLod,
         select: () => {
           try {
+            if ((window as any).__cv?.toggleLodGroup?.(ele.id())) return;
             if (!api) return;
             if (api.isExpandable(ele)) {
               // Preflight: restore any meta-edges so expand can rehydrate leaf edges
@@ -197,6 +200,7 @@ export function installContextMenu(
           enabled: !!api,
           select: () => {
             try {
+              if ((window as any).__cv?.collapseAllLod?.()) return;
               if (!api) return;
               const groups = cy.nodes('node:parent');
               api.collapse(groups, { animate: false });
@@ -207,9 +211,10 @@ export function installContextMenu(
         {
           content: 'Expand all groups',
           enabled: !!api,
-          select: () => {
+          select: async () => {
             try {
               if (!api) return;
+              try { await (window as any).__cv?.ensureFullGraph?.(); } catch {}
               const groups = cy.nodes('node:parent');
               // Preflight: ensure any meta-edges are expanded so leaf edges are restored
               try { if (typeof (api as any).expandAllEdges === 'function') (api as any).expandAllEdges(); } catch {}
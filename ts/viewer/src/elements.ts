@@ -1,5 +1,5 @@
 import type { ElementDefinition } from "cytoscape";
-import type { Graph, ViewerMode } from "./graph-types.js";
+import type { Graph, GraphNode, SummaryEdge, SummaryLevel, SummaryNode, ViewerMode } from "./graph-types.js";
 
 export function graphToElements(graph: Graph, opts: { mode: ViewerMode; groupFolders?: boolean }): ElementDefinition[] {
   const elements: ElementDefinition[] = [];
@@ -74,10 +74,7 @@ export function graphToElements(graph: Graph, opts: { mode: ViewerMode; groupFol
     elements.push({ data: { id: `module:${mod}`, label: name, displayLabel: insertBreakpoints(name), type: "module", path: mod, parent } as any });
   }
 
-  for (const n of graph.nodes) {
-    const displayLabel = insertBreakpoints(n.label);
-    elements.push({ data: { id: n.id, label: n.label, displayLabel, type: n.kind, parent: `module:${n.module}`, module: n.module, file: n.file, line: n.line, endLine: (n as any).endLine ?? null, signature: n.signature ?? '', doc: n.doc ?? '', tags: n.tags ?? {} } });
-  }
+  for (const n of graph.nodes) elements.push(entityElement(n));
 
   let skipped = 0;
   for (const e of graph.edges) {
@@ -93,6 +90,163 @@ export function graphToElements(graph: Graph, opts: { mode: ViewerMode; groupFol
   return elements;
 }
 
+// Static lookups for the level-of-detail view, built once per grouping mode
+export type LodIndex = {
+  start: SummaryLevel; // folder level when grouping by folders, else module level
+  summaryById: Map<string, SummaryNode>; // an id has the same definition at every level
+  parentOf: Map<string, string>; // group or function id -> enclosing group id
+  nodeById: Map<string, GraphNode>;
+  edgesOf: (id: string) => SummaryEdge[]; // weighted edges touching a function; indexed on first use, after first paint
+};
+
+export function buildLodIndex(graph: Graph, groupFolders: boolean): LodIndex | null {
+  const summaries = graph.summaries;
+  if (!summaries) return null;
+  const summaryById = new Map<string, SummaryNode>();
+  for (const level of [summaries.folder, summaries.package, summaries.module]) {
+    for (const sn of level.nodes) summaryById.set(sn.id, sn);
+  }
+  const parentOf = new Map<string, string>();
+  for (const sn of summaryById.values()) {
+    if (!groupFolders && sn.type === "folder") continue;
+    for (const c of sn.children) parentOf.set(c, sn.id);
+  }
+  const nodeById = new Map(graph.nodes.map(n => [n.id, n] as const));
+  let edgesById: Map<string, SummaryEdge[]> | null = null;
+  const edgesOf = (id: string): SummaryEdge[] => {
+    if (!edgesById) edgesById = indexFunctionEdges(graph, nodeById);
+    return edgesById.get(id) ?? [];
+  };
+  return { start: groupFolders ? summaries.folder : summaries.module, summaryById, parentOf, nodeById, edgesOf };
+}
+
+// Call sites deduped into weighted function-level edges (derived here, not shipped)
+function indexFunctionEdges(graph: Graph, nodeById: Map<string, GraphNode>): Map<string, SummaryEdge[]> {
+  const byKey = new Map<string, SummaryEdge>();
+  for (const e of graph.edges) {
+    if (!nodeById.has(e.source) || !nodeById.has(e.target) || e.source === e.target) continue;
+    const k = `${e.source}->${e.kind}->${e.target}`;
+    const cur = byKey.get(k);
+    if (cur) cur.weight += 1;
+    else byKey.set(k, { source: e.source, target: e.target, kind: e.kind, weight: 1 });
+  }
+  const edgesById = new Map<string, SummaryEdge[]>();
+  for (const e of byKey.values()) {
+    for (const id of [e.source, e.target]) {
+      const list = edgesById.get(id);
+      if (list) list.push(e);
+      else edgesById.set(id, [e]);
+    }
+  }
+  return edgesById;
+}
+
+// Level-of-detail elements from the precomputed summaries. Groups not in `expanded`
+// render as single collapsed nodes; expanded groups become compounds holding their
+// children (subfolders, modules, then function nodes). With nothing expanded the
+// starting level's precomputed edges are used as-is; otherwise function-level edges
+// are aggregated onto whatever is currently visible. Module imports stay in the
+// data only, as explore mode does not draw them either.
+export function summaryToElements(graph: Graph, opts: { groupFolders?: boolean; expanded?: Set<string>; index?: LodIndex | null }): ElementDefinition[] {
+  const index = opts.index ?? buildLodIndex(graph, Boolean(opts.groupFolders));
+  if (!index) return graphToElements(graph, { mode: "explore", groupFolders: opts.groupFolders });
+  const expanded = opts.expanded ?? new Set<string>();
+  const elements: ElementDefinition[] = [];
+  const visible: string[] = [];
+  for (const sn of index.start.nodes) visitLod(index, expanded, sn.id, undefined, elements, visible);
+  if (expanded.size > 0) return elements.concat(lodEdgeElements(index, expanded, visible));
+  for (const e of index.start.edges) {
+    if (e.kind !== "imports") elements.push(lodEdgeElement(e));
+  }
+  return elements;
+}
+
+// Children of a just-expanded group and the edges touching them; the rest of the
+// frontier is unchanged, so nothing else needs rebuilding
+export function lodExpandElements(index: LodIndex, expanded: Set<string>, id: string): ElementDefinition[] {
+  const elements: ElementDefinition[] = [];
+  const visible: string[] = [];
+  for (const c of index.summaryById.get(id)?.children ?? []) visitLod(index, expanded, c, id, elements, visible);
+  return elements.concat(lodEdgeElements(index, expanded, visible));
+}
+
+// Aggregated edges with an endpoint inside any of `visibleIds` (collapsed groups or
+// function nodes currently on screen), mapped onto the visible frontier
+export function lodEdgeElements(index: LodIndex, expanded: Set<string>, visibleIds: string[]): ElementDefinition[] {
+  const functionIds: string[] = [];
+  const collect = (id: string) => {
+    const sn = index.summaryById.get(id);
+    if (sn) sn.children.forEach(collect);
+    else functionIds.push(id);
+  };
+  visibleIds.forEach(collect);
+
+  const repCache = new Map<string, string>();
+  const rep = (id: string): string => {
+    let r = repCache.get(id);
+    if (r === undefined) {
+      r = visibleFor(index, expanded, id);
+      repCache.set(id, r);
+    }
+    return r;
+  };
+  const seen = new Set<SummaryEdge>();
+  const byKey = new Map<string, SummaryEdge>();
+  for (const fid of functionIds) {
+    for (const e of index.edgesOf(fid)) {
+      if (seen.has(e)) continue;
+      seen.add(e);
+      const source = rep(e.source);
+      const target = rep(e.target);
+      if (source === target) continue;
+      const k = `${source}->${e.kind}->${target}`;
+      const cur = byKey.get(k);
+      if (cur) cur.weight += e.weight;
+      else byKey.set(k, { source, target, kind: e.kind, weight: e.weight });
+    }
+  }
+  return Array.from(byKey.values(), lodEdgeElement);
+}
+
+// The element that stands for a function or group: its outermost collapsed
+// ancestor, or itself when every enclosing group is expanded
+function visibleFor(index: LodIndex, expanded: Set<string>, id: string): string {
+  const chain = [id];
+  for (let p = index.parentOf.get(id); p; p = index.parentOf.get(p)) chain.push(p);
+  for (let i = chain.length - 1; i > 0; i--) {
+    if (!expanded.has(chain[i])) return chain[i];
+  }
+  return id;
+}
+
+function visitLod(index: LodIndex, expanded: Set<string>, id: string, parent: string | undefined, elements: ElementDefinition[], visible: string[]): void {
+  const n = index.nodeById.get(id);
+  if (n) {
+    elements.push(entityElement(n, parent));
+    visible.push(id);
+    return;
+  }
+  const sn = index.summaryById.get(id);
+  if (!sn) return;
+  const isExpanded = expanded.has(id);
+  const depth = sn.type === "folder" ? sn.path.split("/").length : undefined;
+  elements.push({ data: { id, label: sn.label, displayLabel: insertBreakpoints(sn.label), type: sn.type, path: sn.path, depth, size: sn.size, parent, lod: true } as any, classes: isExpanded ? undefined : "cv-lod-collapsed" });
+  if (isExpanded) {
+    for (const c of sn.children) visitLod(index, expanded, c, id, elements, visible);
+  } else {
+    visible.push(id);
+  }
+}
+
+function lodEdgeElement(e: SummaryEdge): ElementDefinition {
+  return { data: { id: `lod:${e.source}->${e.kind}->${e.target}`, source: e.source, target: e.target, type: e.kind, weight: e.weight }, classes: "cv-lod-edge" };
+}
+
+function entityElement(n: GraphNode, parent: string | undefined = `module:${n.module}`): ElementDefinition {
+  const displayLabel = insertBreakpoints(n.label);
+  return { data: { id: n.id, label: n.label, displayLabel, type: n.kind, parent, module: n.module, file: n.file, line: n.line, endLine: (n as any).endLine ?? null, signature: n.signature ?? '', doc: n.doc ?? '', tags: n.tags ?? {} } };
+}
+
 function insertBreakpoints(text: string): string {
   // Prefer explicit newlines, as Cytoscape wraps reliably on '\n'
   if (text.includes('_')) {
@@ -1,4 +1,5 @@
 // Minimal graph types mirroring docs/reference/DATA_STRUCTURES.md
+import type { GraphSummaries } from "../../src/analyzer/summaries.js";
 
 export type Graph = {
   version: number;
@@ -10,6 +11,7 @@ export type Graph = {
   edges: GraphEdge[];
   groups: GraphGroup[];
   moduleImports?: ModuleImportEdge[];
+  summaries?: GraphSummaries;
 };
 
 export type GraphNode = {
@@ -45,6 +47,10 @@ export type ModuleImportEdge = {
   weight?: number;
 };
 
+// Level-of-detail summaries precomputed at extraction. Declared once, next to the
+// extractor that writes them; type-only, so no CLI code ends up in the bundle.
+export type { SummaryNode, SummaryEdge, SummaryLevel, GraphSummaries } from "../../src/analyzer/summaries.js";
+
 export type ViewerMode = "explore" | "modules";
 
 export type ViewerConfig = {
@@ -56,6 +62,7 @@ export type ViewerConfig = {
   projectName?: string;
   highlight?: HighlightConfig;
   wheelSensitivity?: number;
+  lodMinNodes?: number; // render precomputed summaries first when the graph has at least this many nodes
   colors?: {
     moduleBg?: { h: number; s: number; l: number };
     folderBg?: { h: number; s: number; l: number };
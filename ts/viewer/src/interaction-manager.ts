@@ -98,6 +98,15 @@ export function InteractionManager(cy: Core, graph: Graph, vcfg?: ViewerConfig)
   // module/folder ancestors that contain it. Safe to call even if already visible.
   function expandAncestorsForNodeId(targetNodeId: string): void {
     try {
+      // Level-of-detail view: a node already on screen (summary group or function in an
+      // expanded module) needs no expansion; only a missing one needs the full graph.
+      // Its elements are swapped synchronously and focus runs no layout of its own, so
+      // the hand-over layout is the only one started here.
+      const cv = (window as any).__cv;
+      if (cv?.isLodActive?.()) {
+        if (cy.getElementById(targetNodeId).nonempty()) return;
+        try { cv.ensureFullGraph?.().catch?.(() => {}); } catch {}
+      }
       const api = (cy as any).expandCollapse ? (cy as any).expandCollapse('get') : null;
       if (!api) return;
 
@@ -85,6 +85,9 @@ export function buildLens(cy: Core, ctx: BuildContext): Lens {
 }
 
 export async function applyLens(cy: Core, lens: Lens, ctx: BuildContext): Promise<void> {
+  // Lenses reference entity ids, so leave the level-of-detail view first (the lens
+  // applies its own positions or layout below)
+  try { await (window as any).__cv?.ensureFullGraph?.({ layout: false }); } catch {}
   // Grouping toggle may require full element rebuild
   if (typeof lens.viewer?.groupFolders === 'boolean' && lens.viewer.groupFolders !== ctx.groupFolders) {
     try {
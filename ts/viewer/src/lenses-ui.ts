@@ -78,6 +78,8 @@ export async function installLensesUI(cy: Core, graph: Graph, annotations: any |
     const safe = name.replace(/[^A-Za-z0-9_\-]/g, '').slice(0, 64);
     if (!safe) { alert('Invalid name'); return; }
     try {
+      // Capture from the full graph: the level-of-detail view holds summary nodes only
+      await (window as any).__cv?.ensureFullGraph?.();
       const lens = buildLens(cy, { graph, annotations, groupFolders: ctx.getGroupFolders(), filterMode: (ctx.getFilterMode() as any) || 'fade', layoutName: 'elk-then-fcose' });
       lens.name = safe;
       lens.modifiedAt = new Date().toISOString();
@@ -93,6 +95,8 @@ export async function installLensesUI(cy: Core, graph: Graph, annotations: any |
   async function save(): Promise<void> {
     if (!currentName) return;
     try {
+      // Capture from the full graph: the level-of-detail view holds summary nodes only
+      await (window as any).__cv?.ensureFullGraph?.();
       const lens = buildLens(cy, { graph, annotations, groupFolders: ctx.getGroupFolders(), filterMode: (ctx.getFilterMode() as any) || 'fade', layoutName: 'elk-then-fcose' });
       lens.name = currentName;
       lens.modifiedAt = new Date().toISOString();
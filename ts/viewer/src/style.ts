@@ -15,10 +15,10 @@ export function generateStyles(tokens: Tokens = defaultTokensLight, opts?: { dar
     { selector: 'node', style: { 'label': 'data(displayLabel)', 'text-valign': 'center', 'text-halign': 'center', 'font-size': t.sizes.font, 'background-color': '#fff', 'border-color': '#ddd', 'border-width': widths.nodeBorder, 'text-wrap': 'wrap', 'text-max-width': 120 } },
     { selector: '$node > node', style: { 'background-opacity': 0.2, 'padding': t.sizes.compoundPadding, 'shape': 'round-rectangle' } },
     // Collapsed groups: render as a distinct, strong shape so they don't look like regular nodes
-    { selector: 'node.cy-expand-collapse-collapsed-node', style: { 'shape': 'diamond', 'border-width': 3, 'border-color': '#111827', 'background-opacity': 0.95, 'text-valign': 'center', 'text-halign': 'center', 'text-wrap': 'wrap', 'text-max-width': 200, 'shadow-blur': 8, 'shadow-opacity': 0.25, 'shadow-color': '#111827' } },
+    { selector: 'node.cy-expand-collapse-collapsed-node, node.cv-lod-collapsed', style: { 'shape': 'diamond', 'border-width': 3, 'border-color': '#111827', 'background-opacity': 0.95, 'text-valign': 'center', 'text-halign': 'center', 'text-wrap': 'wrap', 'text-max-width': 200, 'shadow-blur': 8, 'shadow-opacity': 0.25, 'shadow-color': '#111827' } },
     // Ensure collapsed module or folder groups use centered labels (override group label positioning)
-    { selector: 'node[type = "module"].cy-expand-collapse-collapsed-node', style: { 'text-valign': 'center', 'text-halign': 'center', 'font-size': t.sizes.font + 1 } },
-    { selector: 'node[type = "folder"].cy-expand-collapse-collapsed-node', style: { 'text-valign': 'center', 'text-halign': 'center', 'font-weight': 'bold' } },
+    { selector: 'node[type = "module"].cy-expand-collapse-collapsed-node, node[type = "module"].cv-lod-collapsed', style: { 'text-valign': 'center', 'text-halign': 'center', 'font-size': t.sizes.font + 1 } },
+    { selector: 'node[type = "folder"].cy-expand-collapse-collapsed-node, node[type = "folder"].cv-lod-collapsed', style: { 'text-valign': 'center', 'text-halign': 'center', 'font-weight': 'bold' } },
     { selector: 'node[type = "function"]', style: { 'background-color': t.colors.node.function } },
     { selector: 'node[type = "class"]', style: { 'background-color': t.colors.node.class } },
     { selector: 'node[type = "variable"]', style: { 'background-color': t.colors.node.variable } },
@@ -65,6 +65,12 @@ export function generateStyles(tokens: Tokens = defaultTokensLight, opts?: { dar
         try { const n = Math.max(1, Number(edge.data('collapsedEdges')?.length ?? 1)); return 3 + Math.log2(n); } catch { return 3; }
       }
     } },
+    // Precomputed level-of-detail edges: width grows with the aggregated weight
+    { selector: 'edge.cv-lod-edge', style: {
+      'width': (edge: any) => {
+        try { const n = Math.max(1, Number(edge.data('weight') ?? 1)); return 2 + Math.log2(n); } catch { return 2; }
+      }
+    } },
     // Directional highlighting styles
     { selector: '.focus', style: { 'border-width': widths.nodeBorderHighlighted + 1, 'border-color': colors.focus, 'border-opacity': 0.98, 'z-compound-depth': 'top', 'shadow-blur': 12, 'shadow-opacity': 0.45, 'shadow-color': colors.focus, 'text-outline-width': 3 } as any },
     { selector: '.incoming-node', style: { 'border-width': widths.nodeBorderHighlighted, 'border-color': colors.incoming, 'z-compound-depth': 'top', 'text-outline-width': 2 } },
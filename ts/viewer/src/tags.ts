@@ -87,9 +87,11 @@ export function buildTagIndex(graph: Graph, annotations: any | null): TagIndex {
 
 export function computeTagCounts(cy: Core | null, idx: TagIndex): Array<{ key: string; label: string; total: number; visible: number }> {
   const results: Array<{ key: string; label: string; total: number; visible: number }> = [];
+  // In the level-of-detail view missing entities are folded into summary groups, not filtered out
+  const lodActive = typeof window !== 'undefined' && Boolean((window as any).__cv?.isLodActive?.());
   const hiddenCheck = (id: string) => {
     if (!cy) return true;
-    try { const el = cy.getElementById(id); return !el || el.empty() ? true : (String(el.style('display')) === 'none') || el.hasClass('cv-tag-hidden'); } catch { return true; }
+    try { const el = cy.getElementById(id); return !el || el.empty() ? !lodActive : (String(el.style('display')) === 'none') || el.hasClass('cv-tag-hidden'); } catch { return true; }
   };
   for (const key of idx.allTagKeys) {
     const label = idx.tagKeyToDisplay.get(key) || key;
@@ -203,6 +205,13 @@ export async function installTagsWidget(cy: Core, graph: Graph, annotations: any
 
   const idx = buildTagIndex(graph, annotations);
 
+  // Tag filters act on entity nodes, so leave the level-of-detail view first
+  const applySelection = async (next: Set<string>) => {
+    try { await (window as any).__cv?.ensureFullGraph?.(); } catch {}
+    applyTagFilter(cy, idx, next);
+    render(next);
+  };
+
   const render = (selected: Set<string>) => {
     const counts = computeTagCounts(cy, idx);
     const order = sortTagKeysForDisplay(counts.map(c => ({ key: c.key, label: c.label, total: c.total })));
@@ -237,8 +246,8 @@ export async function installTagsWidget(cy: Core, graph: Graph, annotations: any
     // Wire events
     const allBtn = listHost.querySelector('#tagsAllBtn') as HTMLButtonElement | null;
     const noneBtn = listHost.querySelector('#tagsNoneBtn') as HTMLButtonElement | null;
-    if (allBtn) allBtn.onclick = () => { const next = new Set(idx.allTagKeys); applyTagFilter(cy, idx, next); render(next); };
-    if (noneBtn) noneBtn.onclick = () => { const next = new Set<string>(); applyTagFilter(cy, idx, next); render(next); };
+    if (allBtn) allBtn.onclick = () => { applySelection(new Set(idx.allTagKeys)); };
+    if (noneBtn) noneBtn.onclick = () => { applySelection(new Set<string>()); };
 
     listHost.querySelectorAll('input[type="checkbox"]').forEach((el) => {
       el.addEventListener('click', (evt: any) => {
@@ -251,8 +260,7 @@ export async function installTagsWidget(cy: Core, graph: Graph, annotations: any
           next = new Set(selectedNorm);
           if (next.has(key)) next.delete(key); else next.add(key);
         }
-        applyTagFilter(cy, idx, next);
-        render(next);
+        applySelection(next);
       });
     });
   };
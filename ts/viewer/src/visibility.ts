@@ -10,6 +10,8 @@ export function updateAutoGroupVisibility(cy: Core): void {
     const groups = cy.nodes("node[type = 'module'], node[type = 'folder']");
     groups.forEach((g: any) => {
       try {
+        // Collapsed level-of-detail groups stand in for their members and stay visible
+        if (g.hasClass('cv-lod-collapsed')) { g.removeClass('cv-group-hidden-auto'); return; }
         // Consider entity descendants (functions/classes/variables) visibility; if none are visible, hide the group
         const hasVisibleEntityDesc = g.descendants
           ? g.descendants("node[type != 'module'][type != 'folder']:visible").length > 0
@@ -19,11 +21,11 @@ export function updateAutoGroupVisibility(cy: Core): void {
     });
   } catch {}
 
-  // Also hide collapsed meta-edges whose endpoints are hidden by this auto rule
+  // Also hide collapsed meta-edges (and level-of-detail edges) whose endpoints are hidden by this auto rule
   try {
     const hiddenGroupIds = new Set<string>();
     cy.nodes("node[type = 'module'].cv-group-hidden-auto, node[type = 'folder'].cv-group-hidden-auto").forEach((n: any) => { hiddenGroupIds.add(String(n.id())); });
-    cy.edges('.cy-expand-collapse-collapsed-edge').forEach((e: any) => {
+    cy.edges('.cy-expand-collapse-collapsed-edge, .cv-lod-edge').forEach((e: any) => {
       try {
         const sId = String(e.source().id());
         const tId = String(e.target().id());